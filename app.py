@@ -1,7 +1,24 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash, session, g, make_response
 import pymysql
+import asyncio
+import contextvars
+import functools
+import gzip
+import hashlib
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
-from datetime import datetime
+from datetime import datetime, timezone
+from jinja2 import FileSystemBytecodeCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # =====================================================
 # APP INITIALIZATION
@@ -9,119 +26,483 @@ from datetime import datetime
 app = Flask(__name__)
 app.config.from_object(Config)
 app.secret_key = app.config['SECRET_KEY']
+app.logger.setLevel(logging.INFO)
+os.makedirs(app.config['TEMPLATE_CACHE_DIR'], exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config['TEMPLATE_CACHE_DIR'])
 
 # =====================================================
 # DATABASE CONNECTION
 # =====================================================
-def get_db():
+# Reads from read-only routes go to DB_REPLICAS (round robin, skipping lagging
+# or unreachable replicas); everything else, and any read made shortly after
+# the same user committed a change, goes to the primary DB_HOST.
+_replica_counter = itertools.count()
+_replica_state = {}  # "host:port" -> {"lag": seconds or None, "checked": timestamp}
+_pool = {}  # (host, port) -> idle connections, at most DB_POOL_SIZE each
+_pool_lock = threading.Lock()
+
+
+def _connect(host, port):
+    return pymysql.connect(
+        host=host,
+        user=app.config['DB_USER'],
+        password=app.config['DB_PASS'],
+        database=app.config['DB_NAME'],
+        port=port,
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=False
+    )
+
+
+def _acquire(host, port):
+    with _pool_lock:
+        idle = _pool.get((host, port))
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _connect(host, port)
+    conn.ping(reconnect=True)
+    return conn
+
+
+def _release(conn):
     try:
-        conn = pymysql.connect(
-            host=app.config['DB_HOST'],
-            user=app.config['DB_USER'],
-            password=app.config['DB_PASS'],
-            database=app.config['DB_NAME'],
-            port=app.config['DB_PORT'],
-            cursorclass=pymysql.cursors.DictCursor,
-            autocommit=False
-        )
-        conn.ping(reconnect=True)
-        return conn
+        # End the read snapshot so the next borrower sees current data
+        conn.rollback()
+    except pymysql.MySQLError:
+        conn.close()
+        return
+    with _pool_lock:
+        idle = _pool.setdefault((conn.host, conn.port), [])
+        if len(idle) < app.config['DB_POOL_SIZE']:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _replica_lag(conn):
+    with conn.cursor() as cur:
+        try:
+            cur.execute("SHOW REPLICA STATUS")
+        except pymysql.MySQLError:
+            # MySQL < 8.0.22
+            cur.execute("SHOW SLAVE STATUS")
+        row = cur.fetchone()
+    if not row:
+        return None
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return int(lag) if lag is not None else None
+
+
+def _lag_ok(lag):
+    return lag is not None and lag <= app.config['DB_REPLICA_MAX_LAG']
+
+
+def _get_replica():
+    replicas = app.config['DB_REPLICAS']
+    start = next(_replica_counter) % len(replicas)
+    now = time.time()
+    for addr in replicas[start:] + replicas[:start]:
+        state = _replica_state.get(addr)
+        fresh = state is not None and now - state["checked"] < app.config['DB_REPLICA_LAG_CHECK_INTERVAL']
+        if fresh and not _lag_ok(state["lag"]):
+            continue
+        host, _, port = addr.partition(":")
+        conn = None
+        try:
+            conn = _acquire(host, int(port or app.config['DB_PORT']))
+            if not fresh:
+                state = {"lag": _replica_lag(conn), "checked": now}
+                _replica_state[addr] = state
+        except pymysql.MySQLError as e:
+            if conn is not None:
+                conn.close()
+            app.logger.warning(f"Replica {addr} unavailable: {e}")
+            _replica_state[addr] = {"lag": None, "checked": now}
+            continue
+        if _lag_ok(state["lag"]):
+            return conn
+        app.logger.warning(f"Replica {addr} skipped, lag: {state['lag']}")
+        _release(conn)
+    return None
+
+
+def _pinned_to_primary():
+    return session.get("db_primary_until", 0) > time.time()
+
+
+def pin_to_primary():
+    """Call after a commit so the user's next reads see their own writes."""
+    session["db_primary_until"] = time.time() + app.config['DB_PRIMARY_PIN_SECONDS']
+
+
+def _pick_host(read_only=False):
+    """Server for this request's reads: one healthy replica, kept for the whole
+    request so every query of a page sees the same data, or the primary."""
+    if not read_only or not app.config['DB_REPLICAS'] or _pinned_to_primary():
+        return app.config['DB_HOST'], app.config['DB_PORT']
+    if "db_read_host" not in g:
+        conn = _get_replica()
+        if conn is None:
+            g.db_read_host = (app.config['DB_HOST'], app.config['DB_PORT'])
+        else:
+            g.db_read_host = (conn.host, conn.port)
+            _release(conn)
+    return g.db_read_host
+
+
+def _open_db(read_only=False):
+    return _acquire(*_pick_host(read_only))
+
+
+def get_db(read_only=False):
+    try:
+        return _open_db(read_only)
     except pymysql.MySQLError as e:
         app.logger.error(f"Database connection failed: {e}")
         flash("Database connection failed. Please try again later.", "danger")
         return None
 
 
+_table_columns = {}  # table -> column names, filled on first use or by warm_up()
+
+
+def table_columns(cur, table):
+    if table not in _table_columns:
+        cur.execute(f"SHOW COLUMNS FROM {table}")
+        _table_columns[table] = [row['Field'] for row in cur.fetchall()]
+    return _table_columns[table]
+
+
 # =====================================================
-# COMPLEX QUERY ROUTES
+# ASYNC DATA ACCESS
 # =====================================================
-@app.route('/admin/query/<int:query_id>')
-def admin_query(query_id):
-    conn = get_db()
-    if conn is None:
-        return redirect(url_for("admin_dashboard"))
+# pymysql is blocking, so each job runs in a worker thread on a pooled
+# connection; independent jobs of one request overlap their round-trips.
+# This cuts a page's latency, not the worker count: under WSGI the request
+# still holds its worker thread until the page is returned.
+_executor = ThreadPoolExecutor(max_workers=app.config['DB_QUERY_THREADS'], thread_name_prefix="wanderwise-db")
 
+
+async def _in_thread(func, *args):
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(_executor, ctx.run, func, *args)
+
+
+def _run_job(conn, job):
     with conn.cursor() as cur:
-        if query_id == 1:
-            cur.execute("""
-                SELECT u.Name, u.Gmail, t.trip_id, t.total_cost
-                FROM Users u
-                JOIN TRIP t ON u.user_id = t.user_id
-                WHERE t.total_cost > (SELECT AVG(total_cost) FROM TRIP);
-            """)
-            table_name = "Users Who Spent Above Average"
-
-        elif query_id == 2:
-            cur.execute("""
-                SELECT 
-                    h.hotel_name,
-                    l.city_name AS city,
-                    l.country_name AS country,
-                    h.rating,
-                    h.std_google_review,
-                    RANK() OVER (PARTITION BY h.location_id ORDER BY h.rating DESC) AS rating_rank
-                FROM HOTELS h
-                JOIN LOCATION l ON h.location_id = l.location_id
-                WHERE h.rating IS NOT NULL;
-            """)
-            table_name = "Hotel Rankings by Location"
-
-        elif query_id == 3:
-            cur.execute("""
-                SELECT 
-                    u.Name,
-                    COUNT(DISTINCT t.trip_id) AS total_trips,
-                    SUM(t.total_cost) AS total_spent,
-                    AVG(t.total_cost) AS avg_trip_cost
-                FROM Users u
-                JOIN TRIP t ON u.user_id = t.user_id
-                GROUP BY u.user_id, u.Name
-                HAVING SUM(t.total_cost) > 1000;
-            """)
-            table_name = "Total Spending by User"
-
-        elif query_id == 4:
-            cur.execute("""
-                WITH LocationActivityCount AS (
-                    SELECT 
-                        l.city_name,
-                        l.country_name,
-                        COUNT(a.activity_id) AS activity_count
-                    FROM LOCATION l
-                    LEFT JOIN ACTIVITY a ON l.location_id = a.location_id
-                    GROUP BY l.location_id, l.city_name, l.country_name
-                )
-                SELECT * FROM LocationActivityCount
-                WHERE activity_count = (SELECT MAX(activity_count) FROM LocationActivityCount);
-            """)
-            table_name = "Locations with Most Activities"
+        return job(cur)
 
-        elif query_id == 5:
-            cur.execute("""
-                SELECT 
-                    t.trip_id,
-                    u.Name,
-                    f.flight_id,
-                    f.flight_no,
-                    f.airline_name,
-                    f.base_price
-                FROM TRIP t
-                JOIN Users u ON t.user_id = u.user_id
-                JOIN FLIGHT f ON t.flight_id = f.flight_id
-                WHERE f.base_price > (
-                    SELECT AVG(base_price)
-                    FROM FLIGHT
-                );
-            """)
-            table_name = "Flights Above Average Base Price"
 
-        else:
+def fetch_all(sql, args=None):
+    """Job that runs a single query and returns all rows."""
+    def job(cur):
+        cur.execute(sql, args)
+        return cur.fetchall()
+    return job
+
+
+async def run_concurrently(*jobs, read_only=True):
+    """Run independent jobs (functions taking a cursor) concurrently and return
+    their results in order, or None if a connection could not be opened."""
+    try:
+        host, port = await _in_thread(_pick_host, read_only)
+    except pymysql.MySQLError as e:
+        app.logger.error(f"Database connection failed: {e}")
+        flash("Database connection failed. Please try again later.", "danger")
+        return None
+    opened = await asyncio.gather(
+        *(_in_thread(_acquire, host, port) for _ in jobs),
+        return_exceptions=True
+    )
+    conns = [c for c in opened if not isinstance(c, BaseException)]
+    for c in opened:
+        if isinstance(c, BaseException):
+            for conn in conns:
+                _release(conn)
+            if not isinstance(c, pymysql.MySQLError):
+                raise c
+            app.logger.error(f"Database connection failed: {c}")
+            flash("Database connection failed. Please try again later.", "danger")
+            return None
+
+    # Wait for every job, not just the first failure: a connection goes back
+    # to the pool only once its thread is done with it. If this is cancelled
+    # mid-way the connections are dropped rather than pooled.
+    results = await asyncio.gather(
+        *(_in_thread(_run_job, conn, job) for conn, job in zip(conns, jobs)),
+        return_exceptions=True
+    )
+    for conn, result in zip(conns, results):
+        if isinstance(result, BaseException):
             conn.close()
-            return "Invalid query ID", 404
+        else:
+            _release(conn)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
 
-        rows = cur.fetchall()
 
-    conn.close()
+# =====================================================
+# HTTP CACHING
+# =====================================================
+# Pages built from the catalog/trip tables carry an ETag and Last-Modified
+# derived from the DATA_VERSION counters (sql/data_version.sql), so repeat
+# views get a 304 without running the page's queries or rendering it.
+# Routes bump a counter in the same transaction as each write to its tables.
+CATALOG_TABLES = {"LOCATION", "FLIGHT", "HOTELS"}
+
+
+def data_version_of(table):
+    return "catalog" if table.upper() in CATALOG_TABLES else "trip"
+
+
+def bump_data_version(cur, name):
+    """Call in the write's transaction, just before conn.commit(), so the data
+    and its new version become visible together. Going last keeps the shared
+    counter row locked only for the commit."""
+    try:
+        cur.execute(
+            "UPDATE DATA_VERSION SET version = version + 1, updated_at = CURRENT_TIMESTAMP(6) WHERE name = %s",
+            (name,)
+        )
+    except pymysql.err.ProgrammingError as e:
+        # 1146: sql/data_version.sql not loaded, so HTTP caching is off anyway
+        if e.args[0] != 1146:
+            raise
+        app.logger.warning(f"Could not bump data version '{name}': {e}")
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.md5(f.read()).hexdigest()[:12]
+
+
+_templates_dir = os.path.join(app.root_path, app.template_folder)
+_TEMPLATES_DIGEST = hashlib.md5("".join(
+    _file_digest(os.path.join(_templates_dir, name)) for name in sorted(os.listdir(_templates_dir))
+).encode()).hexdigest()[:12]
+
+
+def get_data_versions(names):
+    """Return ({name: version}, last change as UTC datetime), or None."""
+    conn = None
+    try:
+        # Read on the server that will render the page, before its queries:
+        # the page data is then at least as new as the counters labelling it
+        conn = _open_db(read_only=True)
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT name, version, UNIX_TIMESTAMP(updated_at) AS changed_at
+                FROM DATA_VERSION
+                WHERE name IN ({", ".join(["%s"] * len(names))})
+                """,
+                names
+            )
+            rows = cur.fetchall()
+    except pymysql.MySQLError as e:
+        app.logger.warning(f"Data versions unavailable, skipping HTTP caching: {e}")
+        return None
+    finally:
+        if conn is not None:
+            _release(conn)
+    if len(rows) != len(names):
+        return None
+    changed_at = max(float(r["changed_at"]) for r in rows)
+    return {r["name"]: r["version"] for r in rows}, datetime.fromtimestamp(int(changed_at), timezone.utc)
+
+
+def cached_by_data_version(*names):
+    """Answer GETs with 304 while the named DATA_VERSION counters are unchanged."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            # Pages carrying one-time flash messages are never cached
+            if request.method != "GET" or session.get("_flashes"):
+                return app.ensure_sync(view)(*args, **kwargs)
+            versions = get_data_versions(list(names))
+            if versions is None:
+                return app.ensure_sync(view)(*args, **kwargs)
+            counters, last_modified = versions
+
+            etag = hashlib.md5(
+                f"{request.full_path}|{sorted(counters.items())}|{_TEMPLATES_DIGEST}"
+                f"|{_static_assets_digest()}|{datetime.now().year}".encode()
+            ).hexdigest()
+            # Only the ETag is trusted: Last-Modified has one-second resolution,
+            # so If-Modified-Since would miss a second change within that second
+            if request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+            else:
+                response = make_response(app.ensure_sync(view)(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+        return wrapper
+    return decorator
+
+
+_static_digests = {}  # filename -> (mtime, digest)
+
+
+def _static_digest(filename):
+    path = os.path.join(app.static_folder, filename)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _static_digests.get(filename)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _file_digest(path))
+        _static_digests[filename] = cached
+    return cached[1]
+
+
+def _static_assets_digest():
+    # Pages embed ?v=<digest> static URLs, so a CSS-only deploy must change their ETag
+    return "".join(
+        _static_digest(name) or "" for name in sorted(os.listdir(app.static_folder))
+        if os.path.isfile(os.path.join(app.static_folder, name))
+    )
+
+
+@app.url_defaults
+def fingerprint_static(endpoint, values):
+    if endpoint != "static" or "filename" not in values:
+        return
+    digest = _static_digest(values["filename"])
+    if digest is not None:
+        values["v"] = digest
+
+
+def _compress(response):
+    if (response.status_code != 200 or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in ("text/html", "text/css", "application/json")):
+        return
+    data = response.get_data()
+    if len(data) < app.config['COMPRESS_MIN_SIZE']:
+        return
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        response.set_data(brotli.compress(data, quality=5))
+        response.headers["Content-Encoding"] = "br"
+    elif accepted["gzip"]:
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        return
+    response.vary.add("Accept-Encoding")
+
+
+_seen_endpoints = set()
+
+
+@app.before_request
+def start_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def finish_response(response):
+    # Only a URL carrying the current digest may be cached for good; an old or
+    # made-up ?v= would otherwise pin whatever file it gets now under that URL
+    if (request.endpoint == "static" and "v" in request.args
+            and request.args["v"] == _static_digest(request.view_args["filename"])):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = app.config['STATIC_MAX_AGE']
+        response.cache_control.immutable = True
+    _compress(response)
+    elapsed = (time.perf_counter() - g.get("request_start", time.perf_counter())) * 1000
+    response.headers["Server-Timing"] = f"app;dur={elapsed:.1f}"
+    if request.endpoint not in _seen_endpoints:
+        _seen_endpoints.add(request.endpoint)
+        app.logger.info(f"First request to {request.endpoint}: {elapsed:.1f} ms")
+    return response
+
+
+# =====================================================
+# COMPLEX QUERY ROUTES
+# =====================================================
+ADMIN_QUERIES = {
+    1: ("Users Who Spent Above Average", """
+        SELECT u.Name, u.Gmail, t.trip_id, t.total_cost
+        FROM Users u
+        JOIN TRIP t ON u.user_id = t.user_id
+        WHERE t.total_cost > (SELECT AVG(total_cost) FROM TRIP);
+    """),
+    2: ("Hotel Rankings by Location", """
+        SELECT 
+            h.hotel_name,
+            l.city_name AS city,
+            l.country_name AS country,
+            h.rating,
+            h.std_google_review,
+            RANK() OVER (PARTITION BY h.location_id ORDER BY h.rating DESC) AS rating_rank
+        FROM HOTELS h
+        JOIN LOCATION l ON h.location_id = l.location_id
+        WHERE h.rating IS NOT NULL;
+    """),
+    3: ("Total Spending by User", """
+        SELECT 
+            u.Name,
+            COUNT(DISTINCT t.trip_id) AS total_trips,
+            SUM(t.total_cost) AS total_spent,
+            AVG(t.total_cost) AS avg_trip_cost
+        FROM Users u
+        JOIN TRIP t ON u.user_id = t.user_id
+        GROUP BY u.user_id, u.Name
+        HAVING SUM(t.total_cost) > 1000;
+    """),
+    4: ("Locations with Most Activities", """
+        WITH LocationActivityCount AS (
+            SELECT 
+                l.city_name,
+                l.country_name,
+                COUNT(a.activity_id) AS activity_count
+            FROM LOCATION l
+            LEFT JOIN ACTIVITY a ON l.location_id = a.location_id
+            GROUP BY l.location_id, l.city_name, l.country_name
+        )
+        SELECT * FROM LocationActivityCount
+        WHERE activity_count = (SELECT MAX(activity_count) FROM LocationActivityCount);
+    """),
+    5: ("Flights Above Average Base Price", """
+        SELECT 
+            t.trip_id,
+            u.Name,
+            f.flight_id,
+            f.flight_no,
+            f.airline_name,
+            f.base_price
+        FROM TRIP t
+        JOIN Users u ON t.user_id = u.user_id
+        JOIN FLIGHT f ON t.flight_id = f.flight_id
+        WHERE f.base_price > (
+            SELECT AVG(base_price)
+            FROM FLIGHT
+        );
+    """),
+}
+
+
+@app.route('/admin/query/<int:query_id>')
+@cached_by_data_version("catalog", "trip")
+async def admin_query(query_id):
+    if query_id not in ADMIN_QUERIES:
+        return "Invalid query ID", 404
+    table_name, sql = ADMIN_QUERIES[query_id]
+
+    results = await run_concurrently(fetch_all(sql))
+    if results is None:
+        return redirect(url_for("admin_dashboard"))
+    rows, = results
+
     return render_template("admin_table.html", table_name=table_name, rows=rows)
 
 
@@ -137,25 +518,16 @@ def home():
 # 🔍 SEARCH FUNCTIONALITY
 # =====================================================
 @app.route("/search", methods=["GET"])
-def search():
+@cached_by_data_version("catalog", "trip")
+async def search():
     query = request.args.get("query", "").strip()
     list_all = False
     if not query:
         # Show all results when query is empty
         list_all = True
 
-    conn = get_db()
-    if conn is None:
-        return redirect(url_for("user_home"))
-
-    with conn.cursor() as cur:
-        def get_columns(table):
-            cur.execute(f"SHOW COLUMNS FROM {table}")
-            return {row['Field'] for row in cur.fetchall()}
-
-        flight_cols = get_columns('FLIGHT')
-        hotel_cols = get_columns('HOTELS')
-
+    def load_flights(cur):
+        flight_cols = set(table_columns(cur, 'FLIGHT'))
         flight_price_col = 'base_price' if 'base_price' in flight_cols else ('price' if 'price' in flight_cols else None)
         flight_duration_col = 'flight_duration' if 'flight_duration' in flight_cols else ('duration' if 'duration' in flight_cols else None)
 
@@ -169,8 +541,10 @@ def search():
             FROM FLIGHT
             {'' if list_all else 'WHERE flight_no LIKE %s OR airline_name LIKE %s OR dept_airport LIKE %s OR arr_airport LIKE %s'}
         """, (() if list_all else (f"%{query}%", f"%{query}%", f"%{query}%", f"%{query}%")))
-        flights = cur.fetchall()
+        return cur.fetchall()
 
+    def load_hotels(cur):
+        hotel_cols = set(table_columns(cur, 'HOTELS'))
         hotel_select_parts = ['hotel_id', 'hotel_name', 'address', 'rating', 'amenities']
         if 'price_per_night' in hotel_cols:
             hotel_select_parts.append("price_per_night")
@@ -181,13 +555,16 @@ def search():
             FROM HOTELS
             {'' if list_all else 'WHERE hotel_name LIKE %s OR address LIKE %s OR amenities LIKE %s'}
         """, (() if list_all else (f"%{query}%", f"%{query}%", f"%{query}%")))
-        hotels = cur.fetchall()
+        return cur.fetchall()
 
-        # Quick-add requires list of existing trips
-        cur.execute("SELECT trip_id, user_id, start_date, end_date FROM TRIP ORDER BY trip_id DESC LIMIT 100")
-        trips = cur.fetchall()
+    # Quick-add requires list of existing trips
+    load_trips = fetch_all("SELECT trip_id, user_id, start_date, end_date FROM TRIP ORDER BY trip_id DESC LIMIT 100")
+
+    results = await run_concurrently(load_flights, load_hotels, load_trips)
+    if results is None:
+        return redirect(url_for("user_home"))
+    flights, hotels, trips = results
 
-    conn.close()
     return render_template("search_results.html", query=query, flights=flights, hotels=hotels, trips=trips)
 
 
@@ -323,7 +700,9 @@ def book_hotel(hotel_id):
                 _row = cur.fetchone()
                 total = (_row.get("total") if isinstance(_row, dict) else _row[0]) if _row else 0
                 cur.execute("UPDATE TRIP SET total_cost = %s WHERE trip_id = %s", (total, trip_id))
+                bump_data_version(cur, "trip")
                 conn.commit()
+                pin_to_primary()
                 flash(f"Hotel '{hotel['hotel_name']}' booked successfully!", "success")
                 return redirect(url_for("trip_summary", trip_id=trip_id))
         finally:
@@ -441,7 +820,9 @@ def book_flight(flight_id):
                 _row = cur.fetchone()
                 total = (_row.get("total") if isinstance(_row, dict) else _row[0]) if _row else 0
                 cur.execute("UPDATE TRIP SET total_cost = %s WHERE trip_id = %s", (total, trip_id))
+                bump_data_version(cur, "trip")
                 conn.commit()
+                pin_to_primary()
                 flash(f"Flight '{flight['flight_no']}' booked successfully!", "success")
                 return redirect(url_for("trip_summary", trip_id=trip_id))
         finally:
@@ -485,7 +866,9 @@ def remove_trip_flight(trip_id):
             _row = cur.fetchone()
             total = (_row.get("total") if isinstance(_row, dict) else _row[0]) if _row else 0
             cur.execute("UPDATE TRIP SET total_cost = %s WHERE trip_id = %s", (total, trip_id))
+            bump_data_version(cur, "trip")
             conn.commit()
+            pin_to_primary()
             flash("Flight removed from trip. Total updated.", "success")
     finally:
         conn.close()
@@ -531,7 +914,9 @@ def remove_trip_hotel(trip_id):
             _row = cur.fetchone()
             total = (_row.get("total") if isinstance(_row, dict) else _row[0]) if _row else 0
             cur.execute("UPDATE TRIP SET total_cost = %s WHERE trip_id = %s", (total, trip_id))
+            bump_data_version(cur, "trip")
             conn.commit()
+            pin_to_primary()
             flash("Hotel removed from trip. Total updated.", "success")
     finally:
         conn.close()
@@ -542,13 +927,10 @@ def remove_trip_hotel(trip_id):
 # TRIP SUMMARY
 # =====================================================
 @app.route("/trip/<int:trip_id>/summary")
-def trip_summary(trip_id):
-    conn = get_db()
-    if conn is None:
-        return redirect(url_for("user_home"))
-
-    with conn.cursor() as cur:
-        cur.execute("""
+@cached_by_data_version("catalog", "trip")
+async def trip_summary(trip_id):
+    results = await run_concurrently(
+        fetch_all("""
             SELECT 
                 t.trip_id,
                 u.Name AS user_name,
@@ -577,10 +959,8 @@ def trip_summary(trip_id):
             LEFT JOIN HOTELS h ON t.hotel_id = h.hotel_id
             LEFT JOIN FLIGHT f ON t.flight_id = f.flight_id
             WHERE t.trip_id = %s
-        """, (trip_id,))
-        summary = cur.fetchall()
-
-        cur.execute("""
+        """, (trip_id,)),
+        fetch_all("""
             SELECT 
                 TRIGGER_NAME,
                 ACTION_TIMING,
@@ -591,10 +971,12 @@ def trip_summary(trip_id):
             WHERE TRIGGER_SCHEMA = DATABASE()
               AND EVENT_OBJECT_TABLE IN ('TRIP','ACTIVITY')
             ORDER BY EVENT_OBJECT_TABLE, TRIGGER_NAME
-        """)
-        triggers = cur.fetchall()
+        """),
+    )
+    if results is None:
+        return redirect(url_for("user_home"))
+    summary, triggers = results
 
-    conn.close()
     return render_template("trip_summary.html", summary=summary, trip_id=trip_id, triggers=triggers)
 
 
@@ -612,7 +994,7 @@ def admin_redirect():
 
 @app.route('/admin/triggers', endpoint='admin_triggers')
 def admin_triggers():
-    conn = get_db()
+    conn = get_db(read_only=True)
     if conn is None:
         return redirect(url_for('admin_dashboard'))
 
@@ -635,15 +1017,19 @@ def admin_triggers():
     conn.close()
     return render_template('triggers.html', triggers=triggers)
 
+ADMIN_TABLES = ["USERS", "LOCATION", "FLIGHT", "HOTELS", "TRIP", "ACTIVITY"]
+
+
 @app.route('/admin/<string:table_name>', methods=["GET", "POST"], endpoint='admin_table')
+@cached_by_data_version("catalog", "trip")
 def admin_table(table_name):
-    allowed = {"USERS", "LOCATION", "FLIGHT", "HOTELS", "TRIP", "ACTIVITY"}
+    allowed = set(ADMIN_TABLES)
     tname = table_name.upper()
     if tname not in allowed:
         flash("Invalid table selected.", "danger")
         return redirect(url_for('admin_dashboard'))
 
-    conn = get_db()
+    conn = get_db(read_only=request.method == 'GET')
     if conn is None:
         return redirect(url_for('admin_dashboard'))
 
@@ -651,8 +1037,7 @@ def admin_table(table_name):
 
     try:
         with conn.cursor() as cur:
-            cur.execute(f"SHOW COLUMNS FROM {tname}")
-            columns = [c['Field'] for c in cur.fetchall()]
+            columns = table_columns(cur, tname)
             pk_col = pk_map.get(tname)
 
             if request.method == 'POST':
@@ -662,13 +1047,17 @@ def admin_table(table_name):
                     values = [request.form.get(c) for c in ins_fields]
                     placeholders = ", ".join(["%s"] * len(ins_fields))
                     cur.execute(f"INSERT INTO {tname} ({', '.join(ins_fields)}) VALUES ({placeholders})", values)
+                    bump_data_version(cur, data_version_of(tname))
                     conn.commit()
+                    pin_to_primary()
                     flash(f"Inserted new record into {tname}.", "success")
                     return redirect(url_for('admin_table', table_name=tname))
                 elif action == 'delete':
                     pk_val = request.form.get('pk')
                     cur.execute(f"DELETE FROM {tname} WHERE {pk_col} = %s", (pk_val,))
+                    bump_data_version(cur, data_version_of(tname))
                     conn.commit()
+                    pin_to_primary()
                     flash(f"Deleted record with {pk_col} = {pk_val}.", "success")
                     return redirect(url_for('admin_table', table_name=tname))
 
@@ -712,6 +1101,47 @@ def internal_error(error):
     import traceback
     return render_template("errors.html", error_code=500, error_details=traceback.format_exc()), 500
 
+# =====================================================
+# STARTUP WARM-UP
+# =====================================================
+# Runs at import, i.e. before the worker accepts requests, so the first hit
+# to each route doesn't pay for template compilation or schema discovery.
+def warm_up():
+    started = time.perf_counter()
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    templates_done = time.perf_counter()
+
+    conn = get_db()
+    if conn is not None:
+        try:
+            with conn.cursor() as cur:
+                for table in ADMIN_TABLES:
+                    try:
+                        table_columns(cur, table)
+                    except pymysql.MySQLError as e:
+                        app.logger.warning(f"Catalog metadata warm-up failed for {table}: {e}")
+        finally:
+            _release(conn)
+    # Connect to each replica once so its lag is known before the first read
+    for _ in app.config['DB_REPLICAS']:
+        replica = _get_replica()
+        if replica is not None:
+            _release(replica)
+    db_done = time.perf_counter()
+
+    app.logger.info(
+        f"Warm-up finished in {(db_done - started) * 1000:.1f} ms "
+        f"(templates {(templates_done - started) * 1000:.1f} ms, "
+        f"database {(db_done - templates_done) * 1000:.1f} ms, "
+        f"columns loaded for {len(_table_columns)}/{len(ADMIN_TABLES)} tables)"
+    )
+
+
+if app.config['WARM_UP_ON_START']:
+    with app.test_request_context():
+        warm_up()
+
 # =====================================================
 # MAIN
 # =====================================================
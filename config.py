@@ -7,3 +7,34 @@ class Config:
     DB_NAME = os.getenv("DB_NAME", "WanderWise2")
     DB_PORT = int(os.getenv("DB_PORT", 3306))
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
+
+    # Read replicas as "host:port" pairs, comma separated (e.g. "127.0.0.1:3307,127.0.0.1:3308").
+    # Leave empty to send every query to DB_HOST.
+    DB_REPLICAS = [r.strip() for r in os.getenv("DB_REPLICAS", "").split(",") if r.strip()]
+    # Replicas lagging more than this many seconds behind the primary are skipped
+    DB_REPLICA_MAX_LAG = int(os.getenv("DB_REPLICA_MAX_LAG", 5))
+    # How long a replica's lag reading is reused before asking it again; a replica
+    # may serve reads up to DB_REPLICA_MAX_LAG + this many seconds behind
+    DB_REPLICA_LAG_CHECK_INTERVAL = int(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", 2))
+    # Request threads per process in the WSGI server (e.g. gunicorn --threads)
+    WORKER_THREADS = int(os.getenv("WORKER_THREADS", 8))
+    # Threads running the async routes' queries; /search runs 3 at once, so
+    # WORKER_THREADS * 3 lets every request thread run its page without queueing
+    DB_QUERY_THREADS = int(os.getenv("DB_QUERY_THREADS", WORKER_THREADS * 3))
+    # Idle connections kept open per database server for reuse by the async routes;
+    # matching DB_QUERY_THREADS lets every query thread keep its connection
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", DB_QUERY_THREADS))
+    # After a user commits a booking, their reads go to the primary for this many seconds
+    DB_PRIMARY_PIN_SECONDS = int(os.getenv("DB_PRIMARY_PIN_SECONDS", 30))
+
+    # Responses smaller than this many bytes are sent uncompressed
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    # Cache lifetime for fingerprinted static files (url_for('static', ...) adds ?v=<hash>)
+    STATIC_MAX_AGE = int(os.getenv("STATIC_MAX_AGE", 31536000))
+
+    # Compile templates and load table metadata when the app is imported
+    WARM_UP_ON_START = os.getenv("WARM_UP_ON_START", "1") == "1"
+    # Persistent Jinja bytecode cache shared by workers and restarts
+    TEMPLATE_CACHE_DIR = os.getenv(
+        "TEMPLATE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache")
+    )
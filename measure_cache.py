@@ -0,0 +1,47 @@
+"""Measure what HTTP caching saves on repeat views.
+
+Runs against the database configured in config.py (sql/data_version.sql must be loaded):
+
+    python measure_cache.py [path ...]
+
+For each page it prints the bytes and server time of a plain first view, a
+compressed first view, and a repeat view sent with the ETag from the first.
+"""
+import sys
+
+from app import app
+
+DEFAULT_PATHS = ["/search", "/search?query=a", "/trip/1/summary", "/admin/FLIGHT", "/admin/query/2"]
+
+
+def server_ms(response):
+    # Server-Timing: app;dur=12.3
+    return float(response.headers.get("Server-Timing", "app;dur=0").split("dur=")[1])
+
+
+def measure(client, path):
+    plain = client.get(path)
+    compressed = client.get(path, headers={"Accept-Encoding": "br, gzip"})
+    etag = compressed.headers.get("ETag")
+    if etag is None:
+        return path, plain, compressed, None
+    repeat = client.get(path, headers={"Accept-Encoding": "br, gzip", "If-None-Match": etag})
+    return path, plain, compressed, repeat
+
+
+def main(paths):
+    client = app.test_client()
+    print(f"{'page':<22}{'plain':>16}{'compressed':>18}{'repeat':>16}{'saved':>18}")
+    for path, plain, compressed, repeat in (measure(client, p) for p in paths):
+        first = f"{len(plain.get_data())}B {server_ms(plain):.1f}ms"
+        comp = f"{len(compressed.get_data())}B {server_ms(compressed):.1f}ms"
+        if repeat is None:
+            print(f"{path:<22}{first:>16}{comp:>18}{'(no ETag)':>16}")
+            continue
+        again = f"{repeat.status_code} {len(repeat.get_data())}B {server_ms(repeat):.1f}ms"
+        saved = f"{len(plain.get_data()) - len(repeat.get_data())}B {server_ms(plain) - server_ms(repeat):.1f}ms"
+        print(f"{path:<22}{first:>16}{comp:>18}{again:>16}{saved:>18}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or DEFAULT_PATHS)
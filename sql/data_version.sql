@@ -0,0 +1,17 @@
+-- =====================================================
+-- DATA VERSION COUNTERS
+-- Bumped by the app inside each write transaction, so it can
+-- answer conditional GETs (ETag) without re-querying.
+-- catalog = LOCATION, FLIGHT, HOTELS; trip = Users, TRIP, ACTIVITY
+-- Run after wanderwise1_modified.sql:  mysql -u root -p < sql\data_version.sql
+-- =====================================================
+
+USE WanderWise2;
+
+CREATE TABLE DATA_VERSION (
+    name VARCHAR(20) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+);
+
+INSERT INTO DATA_VERSION (name) VALUES ('catalog'), ('trip');